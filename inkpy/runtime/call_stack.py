@@ -18,6 +18,15 @@ class PushPopType(Enum):
 
 class CallStack:
     class Element:
+        __slots__ = (
+            "type",
+            "current_pointer",
+            "temporary_variables",
+            "in_expression_evaluation",
+            "evaluation_stack_height_when_pushed",
+            "function_start_in_output_stream",
+        )
+
         def __init__(
             self,
             type: PushPopType,
@@ -49,6 +58,8 @@ class CallStack:
             return copy
 
     class Thread:
+        __slots__ = ("callstack", "index", "previous_pointer")
+
         def __init__(self):
             self.callstack: list[CallStack.Element] = []
             self.index: int = -1
@@ -57,14 +68,20 @@ class CallStack:
         def copy(self):
             copy = CallStack.Thread()
             copy.index = self.index
-            for element in self.callstack:
-                copy.callstack.append(element.copy())
+            copy.callstack = [element.copy() for element in self.callstack]
             copy.previous_pointer = self.previous_pointer
             return copy
 
+    __slots__ = ("current_element", "current_thread", "start_of_root", "threads")
+
     def __init__(self, story: t.Optional["Story"] = None):
         self.threads: list[CallStack.Thread] = []
 
+        # kept up to date on every push and pop rather than looked up each time,
+        # they're read on every step of the story
+        self.current_thread: CallStack.Thread | None = None
+        self.current_element: CallStack.Element | None = None
+
         if story:
             self.start_of_root = Pointer.start_of(story.root_content_container)
             self.reset()
@@ -91,34 +108,14 @@ class CallStack:
 
         call_stack.start_of_root = self.start_of_root
         call_stack.threads = [t.copy() for t in self.threads]
+        call_stack._update_current()
 
         return call_stack
 
-    @property
-    def current_element(self) -> "Element":
-        thread = self.threads[-1]
-        elements = thread.callstack
-        return elements[-1]
-
     @property
     def current_element_index(self) -> int:
         return len(self.call_stack) - 1
 
-    @property
-    def current_thread(self) -> "Thread":
-        return self.threads[-1]
-
-    @current_thread.setter
-    def current_thread(self, value: "Thread"):
-        if len(self.threads) != 1:
-            raise RuntimeError(
-                "Shouldn't be directly setting the current thread when we have a "
-                "stack of them"
-            )
-
-        self.threads.clear()
-        self.threads.append(value)
-
     @property
     def depth(self) -> int:
         return len(self.elements)
@@ -150,12 +147,14 @@ class CallStack:
             raise RuntimeError("Mismatch push/pop in callstack")
 
         self.call_stack.pop()
+        self._update_current()
 
     def pop_thread(self):
         if not self.can_pop_thread:
             raise RuntimeError("Can't pop thread")
 
         self.threads.remove(self.current_thread)
+        self._update_current()
 
     def push(
         self,
@@ -173,6 +172,7 @@ class CallStack:
         element.function_start_in_output_stream = output_stream_length_with_pushed
 
         self.call_stack.append(element)
+        self.current_element = element
 
     def reset(self):
         thread = CallStack.Thread()
@@ -180,6 +180,26 @@ class CallStack:
             CallStack.Element(PushPopType.Tunnel, self.start_of_root)
         )
         self.threads: list["CallStack.Thread"] = [thread]
+        self._update_current()
+
+    def set_current_thread(self, value: "Thread"):
+        if len(self.threads) != 1:
+            raise RuntimeError(
+                "Shouldn't be directly setting the current thread when we have a "
+                "stack of them"
+            )
+
+        self.threads.clear()
+        self.threads.append(value)
+        self._update_current()
+
+    def _update_current(self):
+        if self.threads:
+            self.current_thread = self.threads[-1]
+            callstack = self.current_thread.callstack
+            self.current_element = callstack[-1] if callstack else None
+        else:
+            self.current_thread = self.current_element = None
 
     def set_temporary_variable(
         self, name: str, value: "Value", declare_new: bool = False, index: int = -1
@@ -11,6 +11,8 @@ from .search_result import SearchResult
 
 
 class Container(InkObject):
+    _is_container = True
+
     class CountFlags(IntEnum):
         Visits = 1
         Turns = 2
@@ -24,6 +26,8 @@ class Container(InkObject):
         self.turn_index_should_be_counted: bool = False
         self.count_at_start_only: bool = False
 
+        self._content_indices: dict[int, int] | None = None
+        self._index_paths: dict[int, Path] = {}
         self._path_to_first_leaf_content: t.Optional[Path] = None
 
         super().__init__(name, **kwargs)
@@ -53,6 +57,9 @@ class Container(InkObject):
     def add_content(self, content: InkObject, name: t.Optional[str] = None):
         content.parent = self
 
+        if self._content_indices is not None:
+            self._content_indices[id(content)] = len(self.content)
+
         self.content.append(content)
 
         if not name:
@@ -68,6 +75,10 @@ class Container(InkObject):
         if not name:
             raise TypeError("Cannot add name content without name")
 
+        # named-only content isn't added through add_content, so parent it here
+        if content.parent is not self:
+            content.parent = self
+
         self.named_content[name] = content
 
     def content_at_path(
@@ -81,7 +92,7 @@ class Container(InkObject):
         container = content = self
 
         for comp in path.components[start:length]:
-            if not isinstance(container, Container):
+            if not container._is_container:
                 result.approximate = True
                 break
 
@@ -111,33 +122,43 @@ class Container(InkObject):
     def dump_string_hierachy(
         self, current_content: t.Optional[InkObject] = None, indent: int = 0
     ) -> str:
-        line = f"{' ' * indent}["
+        lines = []
 
-        if self.has_valid_name:
-            line += f" ({self.name})"
+        # walk with an explicit stack into one list of lines, rather than joining
+        # a string for every nested container, closing brackets go on as lines
+        stack: list[tuple[Container | str, int]] = [(self, indent)]
 
-        if self is current_content:
-            line += " <---"
+        while stack:
+            container, indent = stack.pop()
 
-        lines = [line]
+            if isinstance(container, str):
+                lines.append(container)
+                continue
 
-        indent += 2
+            line = f"{' ' * indent}["
 
-        for content in self.content:
-            if isinstance(content, Container):
-                lines.append(content.dump_string_hierachy(current_content, indent))
-            else:
-                lines.append(f"{' ' * indent}{content!r}")
+            if container.has_valid_name:
+                line += f" ({container.name})"
+
+            if container is current_content:
+                line += " <---"
+
+            lines.append(line)
 
-        if len(self.named_content) > 0:
-            lines.append("-- named: --")
+            pending = []
 
-            for content in self.named_content.values():
-                content = t.cast(Container, content)
-                # lines.append(content.dump_string_hierachy(current_content, indent))
+            for content in container.content:
+                if content._is_container:
+                    pending.append((content, indent + 2))
+                else:
+                    pending.append((f"{' ' * (indent + 2)}{content!r}", 0))
 
-        indent -= 2
-        lines.append(f"{' ' * indent}]")
+            if len(container.named_content) > 0:
+                pending.append(("-- named: --", 0))
+
+            pending.append((f"{' ' * indent}]", 0))
+
+            stack.extend(reversed(pending))
 
         return "\n".join(lines)
 
@@ -166,6 +187,26 @@ class Container(InkObject):
         if value & Container.CountFlags.CountStartOnly > 0:
             self.count_at_start_only = True
 
+    def index_path(self, index: int) -> Path:
+        """Path to the content at index, cached as pointers ask for it repeatedly."""
+        path = self._index_paths.get(index)
+        if path is None:
+            path = self._index_paths[index] = self.path.path_by_appending_component(
+                index
+            )
+
+        return path
+
+    def index_of(self, content: InkObject) -> int:
+        """Index of content in this container, raises ValueError if missing."""
+        if self._content_indices is None:
+            self._content_indices = {id(c): i for i, c in enumerate(self.content)}
+
+        try:
+            return self._content_indices[id(content)]
+        except KeyError:
+            raise ValueError(f"{content!r} is not in container") from None
+
     @property
     def named_only_content(self) -> dict[str, InkObject]:
         return {k: v for k, v in self.named_content.items() if v not in self.content}
@@ -181,7 +222,7 @@ class Container(InkObject):
                     components.append(Path.Component(0))
                     container = container.content[0]
 
-            relative_path = Path(components, is_relative=True)
+            relative_path = Path(*components, is_relative=True)
 
             # TODO: convert path to absolute
             path = relative_path
@@ -7,6 +7,14 @@ from .pointer import Pointer
 
 
 class Divert(InkObject):
+    # token key: (pushes_to_stack, stack_push_type, is_external)
+    TOKEN_TYPES = {
+        "->": (False, PushPopType.Function, False),
+        "f()": (True, PushPopType.Function, False),
+        "->t->": (True, PushPopType.Tunnel, False),
+        "x()": (False, PushPopType.Function, True),
+    }
+
     def __init__(self, stack_push_type: PushPopType | None = None):
         self.pushes_to_stack = stack_push_type is not None
         self.stack_push_type = stack_push_type
@@ -41,6 +49,34 @@ class Divert(InkObject):
                 f"({self.target_path!r})"
             )
 
+    @classmethod
+    def from_token(cls, token: dict, key: str | None = None) -> "Divert":
+        """Create a divert from its serialised token, key is the divert key if known."""
+        if key is None:
+            key = next(k for k in token if k in cls.TOKEN_TYPES)
+
+        divert = cls()
+        (
+            divert.pushes_to_stack,
+            divert.stack_push_type,
+            divert.is_external,
+        ) = cls.TOKEN_TYPES[key]
+
+        target = str(token[key])
+
+        if token.get("var"):
+            divert.variable_divert_name = target
+        else:
+            divert.target_path_string = target
+
+        divert.is_conditional = token.get("c", False)
+
+        if divert.is_external:
+            if value := token.get("exArgs"):
+                divert.external_args = int(value)
+
+        return divert
+
     @property
     def has_variable_target(self):
         return self.variable_divert_name is not None
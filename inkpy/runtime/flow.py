@@ -4,8 +4,10 @@ from .object import InkObject
 
 
 class Flow:
-    def __init__(self, name, story):
+    __slots__ = ("name", "call_stack", "current_choices", "output_stream")
+
+    def __init__(self, name, story, call_stack: CallStack | None = None):
         self.name = name
-        self.call_stack = CallStack(story)
+        self.call_stack = call_stack if call_stack is not None else CallStack(story)
         self.current_choices: list[Choice] = []
         self.output_stream: list[InkObject] = []
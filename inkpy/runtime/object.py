@@ -1,5 +1,10 @@
 import typing as t
 
+from collections import deque
+from functools import lru_cache
+from itertools import takewhile
+from operator import eq
+
 from .path import Path
 
 if t.TYPE_CHECKING:
@@ -7,17 +12,68 @@ if t.TYPE_CHECKING:
     from .search_result import SearchResult
 
 
+# the same source/target pairs recur as a story moves back and forth
+@lru_cache(maxsize=1024)
+def _convert_path_to_relative(own_path: Path, global_path: Path) -> Path:
+    _, own_key = own_path._key
+    _, global_key = global_path._key
+
+    # length of the common prefix, counted without leaving C
+    shared = sum(takewhile(bool, map(eq, own_key, global_key)))
+
+    # no shared path components, so just use global path
+    if shared == 0:
+        return global_path
+
+    upward_moves = len(own_path) - shared
+
+    components = [Path.Component.parent()] * upward_moves
+    components.extend(global_path.components[shared:])
+
+    return Path._from_components(components, is_relative=True)
+
+
 class InkObject:
+    # cheaper than isinstance against Container, which would need a local import
+    _is_container = False
+
+    # most runtime objects are never named, parented at construction or asked for
+    # their path, so these are left as class defaults until first written
+    name: t.Optional[str] = None
+    _parent: t.Optional["Container"] = None
+    _path: t.Optional[Path] = None
+    _path_string: t.Optional[str] = None
+    _root_content_container: t.Optional["Container"] = None
+
     def __init__(
         self, name: t.Optional[str] = None, parent: t.Optional["Container"] = None
     ):
-        self.name = name
-        self._parent = parent
+        if name is not None:
+            self.name = name
+        if parent is not None:
+            self._parent = parent
 
-        self._path: t.Optional[Path] = None
+    def compact_path_string(self, path: Path) -> str:
+        if path.is_relative:
+            relative_path_string = str(path)
+            global_path_string = str(self.path.path_by_appending_path(path))
+        else:
+            global_path_string = str(path)
 
-    def compact_path_string(self, path: str) -> str:
-        return path
+            # each upward move costs two characters in the relative form, so when
+            # we're far deeper than the target it can't win, don't build it
+            if 2 * (len(self.path) - len(path)) >= len(global_path_string):
+                return global_path_string
+
+            relative_path_string = str(self.convert_path_to_relative(path))
+
+        if len(relative_path_string) < len(global_path_string):
+            return relative_path_string
+        else:
+            return global_path_string
+
+    def convert_path_to_relative(self, global_path: Path) -> Path:
+        return _convert_path_to_relative(self.path, global_path)
 
     @property
     def has_valid_name(self):
@@ -32,58 +88,96 @@ class InkObject:
         if self._parent:
             raise RuntimeError(f"Content already has parent: {self._parent!r}")
         self._parent = value
+        self._invalidate_path_caches()
+
+    def _invalidate_path_caches(self):
+        # everything below this object may have cached a path or root from before
+        # it was attached, and those all depend on where it's attached
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+
+            # most objects have never been asked, don't shadow the class defaults
+            if obj._path is not None:
+                obj._path = obj._path_string = None
+            if obj._root_content_container is not None:
+                obj._root_content_container = None
+
+            if obj._is_container:
+                obj._index_paths.clear()
+                stack.extend(obj.content)
+                stack.extend(obj.named_content.values())
 
     @property
     def path(self) -> Path:
         if self._path is None:
-            if self.parent is None:
+            parent = self._parent
+
+            if parent is None:
                 self._path = Path()
+            elif parent._path is not None:
+                # parent already knows its path, just add our own component
+                if self.has_valid_name:
+                    component = self.name
+                else:
+                    component = parent.index_of(self)
+
+                self._path = parent._path.path_by_appending_component(component)
             else:
-                components = []
+                components = deque()
 
                 child = self
-                container = child.parent
+                container = child._parent
 
                 while container:
                     if child.has_valid_name:
-                        components.insert(0, child.name)
+                        components.appendleft(child.name)
                     else:
-                        components.insert(0, container.content.index(child))
+                        components.appendleft(container.index_of(child))
 
                     child = container
-                    container = container.parent
+                    container = container._parent
 
                 self._path = Path(*components)
 
         return self._path
 
-    def resolve_path(self, path: "Path") -> "SearchResult":
-        from .container import Container
+    @property
+    def path_string(self) -> str:
+        if self._path_string is None:
+            self._path_string = str(self.path)
+
+        return self._path_string
 
+    def resolve_path(self, path: "Path") -> "SearchResult":
         if path.is_relative:
             nearest_container = self
-            if not isinstance(nearest_container, Container):
+            if not nearest_container._is_container:
                 assert self.parent, "Can't resolve relative path without parent"
 
                 nearest_container = self.parent
 
-                assert isinstance(
-                    nearest_container, Container
+                assert (
+                    nearest_container._is_container
                 ), "Expected parent to be a container"
 
+                # the leading ^ steps out of this object into its container
+                path = path.tail
+
             return nearest_container.content_at_path(path)
         else:
             return self.root_content_container.content_at_path(path)
 
     @property
     def root_content_container(self) -> "Container":
-        from .container import Container
-
-        ancestor = self
-        while ancestor.parent:
-            ancestor = ancestor.parent
-            assert isinstance(ancestor, Container), "Expected parent to be a container"
-        return ancestor
+        if self._root_content_container is None:
+            ancestor = self
+            while ancestor.parent:
+                ancestor = ancestor.parent
+                assert ancestor._is_container, "Expected parent to be a container"
+            self._root_content_container = ancestor
+
+        return self._root_content_container
 
 
 """<iframe src="https://scribehow.com/embed/Registering_a_Payment_for_a_Foreign_Currency_Invoice__lWwPvSx5SVaVPR4JqZ8fmQ" width="100%" height="640" allowfullscreen frameborder="0"></iframe>
@@ -2,21 +2,48 @@ from __future__ import annotations
 
 import typing as t
 
+from functools import lru_cache
+
 
 class Path:
+    __slots__ = ("components", "is_relative", "_key_cache", "_str_cache")
+
     PARENT_ID = "^"
 
+    _interned_components: dict[int | str, "Path.Component"] = {}
+
     class Component:
-        def __init__(self, index_or_name: int | str):
+        __slots__ = ("index", "name", "is_index", "is_parent")
+
+        def __new__(cls, index_or_name: int | str):
+            # True == 1 as a dict key, so it would get the interned index component
+            if isinstance(index_or_name, bool):
+                raise TypeError(f"Invalid path component: {index_or_name!r}")
+
+            # interned components are shared and already set up, hand them back as
+            # they are, which is also why there's no __init__ to run on them again
+            component = Path._interned_components.get(index_or_name)
+            if component is not None:
+                return component
+
+            component = super().__new__(cls)
+
             if isinstance(index_or_name, int):
-                self.index = index_or_name
-                self.name = None
+                component.index = index_or_name
+                component.name = None
             elif isinstance(index_or_name, str):
-                self.index = None
-                self.name = index_or_name
+                component.index = None
+                component.name = index_or_name
+
+            component.is_index = component.name is None and component.index is not None
+            component.is_parent = component.name == Path.PARENT_ID
+
+            return component
 
         def __eq__(self, other):
-            if isinstance(other, Path.Component):
+            if self is other:
+                return True
+            elif isinstance(other, Path.Component):
                 if self.is_index == other.is_index:
                     if self.is_index:
                         return self.index == other.index
@@ -28,32 +55,23 @@ class Path:
         def __str__(self):
             return self.is_index and str(self.index) or self.name
 
-        @property
-        def is_index(self) -> bool:
-            return self.name is None and self.index is not None
-
-        @property
-        def is_parent(self) -> bool:
-            return self.name == Path.PARENT_ID
-
         @staticmethod
         def parent() -> "Path.Component":
-            return Path.Component(Path.PARENT_ID)
+            return Path._interned_components[Path.PARENT_ID]
 
     def __init__(self, *components: Component | int | str, is_relative: bool = False):
         self.components: list[Path.Component] = []
         self.is_relative = is_relative
 
+        self._key_cache: tuple | None = None
+        self._str_cache: str | None = None
+
         for i, component in enumerate(components):
             if isinstance(component, str):
                 if i == 0 and component.startswith("."):
                     self.is_relative = True
 
-                for c in component.split("."):
-                    if not c:
-                        continue
-
-                    self.components.append(Path.Component(c))
+                self.components.extend(_parse_components(component))
 
                 continue
 
@@ -62,19 +80,23 @@ class Path:
 
             self.components.append(component)
 
+    @classmethod
+    def _from_components(
+        cls, components: list[Component], is_relative: bool = False
+    ) -> "Path":
+        """Build a path from a list of components we already own, skipping parsing."""
+        path = cls.__new__(cls)
+        path.components = components
+        path.is_relative = is_relative
+        path._key_cache = None
+        path._str_cache = None
+        return path
+
     def __eq__(self, other):
         if not isinstance(other, Path):
             return False
-        elif len(self) != len(other):
-            return False
-        elif self.is_relative != other.is_relative:
-            return False
-
-        for self_component, other_component in zip(self, other):
-            if self_component != other_component:
-                return False
 
-        return True
+        return self._key == other._key
 
     def __getitem__(self, key: int) -> Component:
         return self.components[key]
@@ -85,8 +107,21 @@ class Path:
     def __len__(self):
         return len(self.components)
 
+    def __hash__(self):
+        return hash(self._key)
+
     def __repr__(self):
-        return f"{self.is_relative and '.' or ''}{'.'.join(map(str, self.components))}"
+        return str(self)
+
+    def __str__(self):
+        # paths aren't modified once built, so only join the components once
+        if self._str_cache is None:
+            self._str_cache = (
+                f"{self.is_relative and '.' or ''}"
+                f"{'.'.join(map(str, self.components))}"
+            )
+
+        return self._str_cache
 
     def __truediv__(self, other: Component | t.Type["Path"] | int | str):
         if isinstance(other, Path):
@@ -94,6 +129,17 @@ class Path:
         else:
             return self.path_by_appending_component(other)
 
+    @property
+    def _key(self) -> tuple:
+        # compare and hash paths as a flat tuple rather than component by component
+        if self._key_cache is None:
+            self._key_cache = (
+                self.is_relative,
+                tuple(c.index if c.is_index else c.name for c in self.components),
+            )
+
+        return self._key_cache
+
     @property
     def last_component(self) -> t.Optional[Component]:
         if self.components:
@@ -103,33 +149,46 @@ class Path:
         if not isinstance(component, Path.Component):
             component = Path.Component(component)
 
-        return Path(*self.components, component, is_relative=self.is_relative)
-
-    def path_by_appending_path(self, path: t.Type["Path"] | int | str) -> "Path":
-        p = Path()
+        return Path._from_components(
+            [*self.components, component], is_relative=self.is_relative
+        )
 
+    def path_by_appending_path(self, path: "Path") -> "Path":
         upward_moves = 0
         for component in path.components:
-            if component.is_parent:
-                upward_moves += 1
-            else:
+            if not component.is_parent:
                 break
+            upward_moves += 1
 
-        for component in self.components[1 : -upward_moves - 1]:
-            p.components.append(component)
-
-        for component in path.components[upward_moves:]:
-            p.components.append(component)
+        components = self.components[: max(len(self.components) - upward_moves, 0)]
+        components += path.components[upward_moves:]
 
-        return p
+        return Path._from_components(components, is_relative=self.is_relative)
 
     @staticmethod
     def self() -> "Path":
-        return Path(is_relative=True)
+        return _SELF_PATH
 
     @property
     def tail(self) -> "Path":
         if len(self.components) >= 2:
-            return Path(self.components[1:])
+            return Path._from_components(self.components[1:])
         else:
             return Path.self()
+
+
+@lru_cache(maxsize=4096)
+def _parse_components(path: str) -> tuple[Path.Component, ...]:
+    """Parse a dotted path string, stories reuse the same few path strings a lot."""
+    # numeric segments are indices, the same as when they're given as ints
+    return tuple(
+        Path.Component(int(c) if c.isdecimal() else c) for c in path.split(".") if c
+    )
+
+
+# small indices and the parent marker make up most components, share one instance
+Path._interned_components.update({i: Path.Component(i) for i in range(256)})
+Path._interned_components[Path.PARENT_ID] = Path.Component(Path.PARENT_ID)
+
+# paths aren't modified once built, so the empty relative path can be shared
+_SELF_PATH = Path(is_relative=True)
@@ -4,9 +4,12 @@ import typing as t
 if t.TYPE_CHECKING:
     from .container import Container
     from .object import InkObject
+    from .path import Path
 
 
 class Pointer:
+    __slots__ = ("container", "index")
+
     def __init__(self, container: t.Optional["Container"] = None, index: int = -1):
         self.container = container
         self.index = index
@@ -21,22 +24,33 @@ class Pointer:
         return False
 
     def __repr__(self):
-        container = self.container and str(self.container.path) or None
+        container = self.container and self.container.path_string or None
 
         return f"Pointer({container}, {self.index})"
 
+    @property
+    def path(self) -> t.Optional["Path"]:
+        if self.container is None:
+            return
+        elif self.index < 0:
+            return self.container.path
+
+        return self.container.index_path(self.index)
+
     def copy(self) -> "Pointer":
         return Pointer(self.container, self.index)
 
     def resolve(self) -> "InkObject":
-        if self.container is None:
+        container = self.container
+        if container is None:
             return
         elif self.index < 0:
-            return self.container
-        elif self.index > len(self.container.content):
-            return
+            return container
 
-        return self.container.content[self.index]
+        try:
+            return container.content[self.index]
+        except IndexError:
+            return
 
     @staticmethod
     def start_of(container: "Container") -> "Pointer":
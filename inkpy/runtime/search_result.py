@@ -1,15 +1,33 @@
-import typing as t
+from __future__ import annotations
 
-from dataclasses import dataclass
+import typing as t
 
 from .object import InkObject
 
+if t.TYPE_CHECKING:
+    from .container import Container
+
 
-@dataclass
 class SearchResult:
-    approximate: bool = False
-    content: InkObject | None = None
+    __slots__ = ("approximate", "content")
+
+    def __init__(self, approximate: bool = False, content: InkObject | None = None):
+        self.approximate = approximate
+        self.content = content
+
+    def __repr__(self):
+        return (
+            f"SearchResult(approximate={self.approximate!r}, content={self.content!r})"
+        )
+
+    @property
+    def container(self) -> Container | None:
+        # the class flag avoids importing Container, which imports this module
+        content = self.content
+        if content is not None and content._is_container:
+            return content
 
     @property
-    def container(self):
-        return self.content
+    def correct_content(self) -> InkObject | None:
+        if not self.approximate:
+            return self.content
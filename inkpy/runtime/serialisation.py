@@ -55,7 +55,13 @@ import json
 import logging
 import typing as t
 
-from .call_stack import PushPopType
+from functools import partial
+
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None
+
 from .choice_point import ChoicePoint
 from .container import Container
 from .control_command import ControlCommand
@@ -88,18 +94,48 @@ INK_VERSION_MINIMUM_COMPATIBLE = 18
 logger = logging.getLogger(__name__)
 
 
+class _RuntimeEncoder(json.JSONEncoder):
+    """Encode runtime objects as they're reached instead of dumping the whole tree
+    to lists and dicts first."""
+
+    def default(self, obj):
+        if isinstance(obj, InkObject):
+            if obj._is_container:
+                # children are left for the encoder to pass back through here
+                content = list(obj.content)
+                terminator = _container_terminator(obj)
+                if terminator or content:
+                    content.append(terminator)
+                return content
+
+            return dump_runtime_object(obj)
+
+        return super().default(obj)
+
+
 def _dump(story: "Story", output: t.TextIO | None = None) -> str | None:
-    root = dump_runtime_container(story._main_content_container)
+    # orjson encodes in C when it's installed, the output is the same compact json
+    if orjson is not None:
+        root = dump_runtime_container(story._main_content_container)
+        s = orjson.dumps({"inkVersion": INK_VERSION_CURRENT, "root": root}).decode()
+    else:
+        data = {
+            "inkVersion": INK_VERSION_CURRENT,
+            "root": story._main_content_container,
+        }
+
+        encoder = _RuntimeEncoder(separators=(",", ":"))
 
-    data = {
-        "inkVersion": INK_VERSION_CURRENT,
-        "root": root,
-    }
+        if output:
+            output.writelines(encoder.iterencode(data))
+            return
+
+        s = encoder.encode(data)
 
     if output:
-        json.dump(data, output, separators=(",", ":"))
+        output.write(s)
     else:
-        return json.dumps(data, separators=(",", ":"))
+        return s
 
 
 def dump(story: "Story", output: t.TextIO):
@@ -110,60 +146,122 @@ def dumps(story: "Story") -> str:
     return _dump(story)
 
 
-def dump_runtime_container(container: Container):
-    obj = []
-
-    for content in container.content:
-        obj.append(dump_runtime_object(content))
-
-    terminator = {}
+def _container_terminator(
+    container: Container, dump: t.Callable[[InkObject], t.Any] | None = None
+) -> dict | None:
+    # most containers have nothing to put in a terminator, and checking
+    # named_content avoids working out named_only_content at all
+    if not container.named_content and not container.flags and not container.name:
+        return
 
-    for name, content in container.named_only_content.items():
-        terminator[name] = dump_runtime_object(content)
+    if dump is None:
+        terminator = dict(container.named_only_content)
+    else:
+        terminator = {
+            name: dump(content)
+            for name, content in container.named_only_content.items()
+        }
 
     if container.flags:
         terminator["#f"] = container.flags
 
-    if container.name:
+    # named-only content is written under its name already, so don't repeat it
+    if container.name and not _is_named_only(container):
         terminator["#n"] = container.name
 
+    return terminator or None
+
+
+def _is_named_only(content: InkObject) -> bool:
+    parent = content.parent
+    if parent is None:
+        return False
+
+    try:
+        parent.index_of(content)
+    except ValueError:
+        return True
+
+    return False
+
+
+def dump_runtime_container(container: Container):
+    # dump_runtime_object is defined below, look it up once rather than per item
+    dump = dump_runtime_object
+
+    obj = [dump(content) for content in container.content]
+
+    terminator = _container_terminator(container, dump)
+
     if terminator or obj:
-        obj.append(terminator or None)
+        obj.append(terminator)
 
     return obj
 
 
-def dump_runtime_object(obj: InkObject):
+def _dump_string_value(obj: StringValue):
     # string values and newlines
-    if isinstance(obj, StringValue):
-        if obj.value == "\n":
-            return "\n"
-        else:
-            return f"^{obj.value}"
+    value = obj.value
+    if value == "\n":
+        return "\n"
+    else:
+        return f"^{value}"
+
+
+def _dump_value(obj: Value):
+    return obj.value
+
+
+def _dump_glue(obj: Glue):
+    return "<>"
+
+
+def _dump_void(obj: Void):
+    return "void"
+
+
+# keyed on the exact type so dumping a node is a single lookup, subclasses are
+# resolved through their mro and added on first use
+_dumpers: dict[type, t.Callable[[t.Any], t.Any]] = {
+    StringValue: _dump_string_value,
+    BoolValue: _dump_value,
+    FloatValue: _dump_value,
+    IntValue: _dump_value,
+    Glue: _dump_glue,
+    Void: _dump_void,
+    Container: dump_runtime_container,
+}
+
+
+def dump_runtime_object(obj: InkObject):
+    dumper = _dumpers.get(type(obj))
 
-    # basic types
-    elif isinstance(obj, (BoolValue, FloatValue, IntValue)):
-        return obj.value
+    if dumper is None:
+        for cls in type(obj).__mro__[1:]:
+            if dumper := _dumpers.get(cls):
+                _dumpers[type(obj)] = dumper
+                break
+        else:
+            raise RuntimeError(f"Failed to convert runtime object to token: '{obj}'")
 
-    elif isinstance(obj, Glue):
-        return "<>"
+    return dumper(obj)
 
-    # void
-    elif isinstance(obj, Void):
-        return "void"
 
-    # containers
-    elif isinstance(obj, Container):
-        return dump_runtime_container(obj)
+def _object_hook(obj: dict) -> dict | InkObject:
+    # build runtime objects from dict tokens while the json is still being parsed,
+    # anything else (the top level, terminators, list definitions) stays a dict
+    for key in obj:
+        if loader := _dict_token_loaders.get(key):
+            return loader(obj, key)
 
-    raise RuntimeError(f"Failed to convert runtime object to token: '{obj}'")
+    return obj
 
 
 def load(data: dict | str | t.TextIO):
     if isinstance(data, str):
-        data = json.loads(data)
+        data = json.loads(data, object_hook=_object_hook)
     elif not isinstance(data, dict):
-        data = json.load(data)
+        data = json.load(data, object_hook=_object_hook)
 
     try:
         version = int(data["inkVersion"])
@@ -200,149 +298,185 @@ def load(data: dict | str | t.TextIO):
     return root, list_defs
 
 
-def load_runtime_container(obj: list) -> Container:
+def _create_runtime_container(obj: list) -> Container:
     container = Container()
 
-    for content in obj[:-1]:
-        container.add_content(load_runtime_object(content))
-
+    # name and flags are set up front so the parent can register the name when
+    # the (still empty) container is added to it
     if obj and (terminator := obj[-1]):
-        for name, content in terminator.items():
-            if name == "#f":
-                container.flags = content
-            elif name == "#n":
-                container.name = content
-            else:
-                content = load_runtime_object(content)
-                container.add_named_content(content, name)
-
-    logger.debug(container.dump_string_hierachy())
+        if "#f" in terminator:
+            container.flags = terminator["#f"]
+        if "#n" in terminator:
+            container.name = terminator["#n"]
 
     return container
 
 
-def load_runtime_object(obj) -> InkObject:
-    logger.debug(obj)
-
-    if isinstance(obj, (bool, float, int)):
-        return Value.create(obj)
-
-    elif isinstance(obj, list):
-        return load_runtime_container(obj)
-
-    elif isinstance(obj, str):
-        # strings and newlines
-        if obj and obj[0] == "^":
-            return StringValue(obj[1:])
-        elif obj == "\n":
-            return StringValue(obj)
-
-        # glue
-        if obj == "<>":
-            return Glue()
-
-        if ControlCommand.exists_with_name(obj):
-            return ControlCommand(obj)
-
-        # void
-        if obj == "void":
-            return Void()
-
-    elif isinstance(obj, dict):
-        # divert target value
-        if value := obj.get("^->"):
-            return DivertTargetValue(Path(str(value)))
-
-        # variable pointer value
-        if value := obj.get("^var"):
-            var_pointer = VariablePointerValue(str(value))
-            if value := obj.get("ci"):
-                var_pointer.index = int(value)
-            return var_pointer
-
-        # divert
-        is_divert = False
-        pushes_to_stack = False
-        stack_push_type = PushPopType.Function
-        is_external = False
-
-        if value := obj.get("->"):
-            is_divert = True
-        elif value := obj.get("f()"):
-            is_divert = True
-            pushes_to_stack = True
-        elif value := obj.get("->t->"):
-            is_divert = True
-            pushes_to_stack = True
-            stack_push_type = PushPopType.Tunnel
-        elif value := obj.get("x()"):
-            is_divert = True
-            is_external = True
-
-        if is_divert:
-            divert = Divert()
-            divert.pushes_to_stack = pushes_to_stack
-            divert.stack_push_type = stack_push_type
-            divert.is_external = is_external
-
-            target = str(value)
-
-            if value := obj.get("var"):
-                divert.variable_divert_name = target
+def load_runtime_container(obj: list) -> Container:
+    root = _create_runtime_container(obj)
+
+    # fill nested containers from an explicit stack instead of recursing
+    stack = [(root, obj)]
+
+    while stack:
+        container, obj = stack.pop()
+
+        for content in obj[:-1]:
+            if isinstance(content, list):
+                child = _create_runtime_container(content)
+                stack.append((child, content))
+                container.add_content(child)
             else:
-                divert.target_path_string = target
+                container.add_content(load_runtime_object(content))
 
-            divert.is_conditional = obj.get("c", False)
+        if obj and (terminator := obj[-1]):
+            for name, content in terminator.items():
+                if name == "#f" or name == "#n":
+                    continue
+                elif isinstance(content, list):
+                    child = _create_runtime_container(content)
+                    child.name = name
+                    stack.append((child, content))
+                    container.add_named_content(child, name)
+                else:
+                    content = load_runtime_object(content)
+                    container.add_named_content(content, name)
 
-            if is_external:
-                if value := obj.get("exArgs"):
-                    divert.external_args = int(value)
+    # dumping the hierachy walks the whole story, only do it when it'll be seen
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(root.dump_string_hierachy())
 
-            return divert
+    return root
 
-        # choice point
-        if value := obj.get("*"):
-            choice = ChoicePoint()
-            choice.path_string_on_choice = str(value)
 
-            if value := obj.get("flg"):
-                choice.flags = int(value)
+def _load_divert_target_value(obj: dict, key: str) -> DivertTargetValue:
+    return DivertTargetValue(Path(str(obj[key])))
 
-            return choice
 
-        # variable reference
-        if value := obj.get("VAR?"):
-            return VariableReference(str(value))
-        elif value := obj.get("CNT?"):
-            read_count_ref = VariableReference()
-            read_count_ref.path_string_for_count = str(value)
-            return read_count_ref
+def _load_variable_pointer_value(obj: dict, key: str) -> VariablePointerValue:
+    var_pointer = VariablePointerValue(str(obj[key]))
+    if value := obj.get("ci"):
+        var_pointer.index = int(value)
+    return var_pointer
 
-        # variable assignment
-        is_variable_assign = False
-        is_global_var = False
-        if value := obj.get("VAR="):
-            is_variable_assign = True
-            is_global_var = True
-        elif value := obj.get("temp="):
-            is_variable_assign = True
 
-        if is_variable_assign:
-            variable_name = str(value)
-            is_new_declaration = not obj.get("re")
-            var_assign = VariableAssignment(variable_name, is_new_declaration)
-            var_assign.is_global = is_global_var
-            return var_assign
+def _load_choice_point(obj: dict, key: str) -> ChoicePoint:
+    choice = ChoicePoint()
+    choice.path_string_on_choice = str(obj[key])
 
-        # TODO: legacy tag
+    if value := obj.get("flg"):
+        choice.flags = int(value)
 
-        # TODO: list value
+    return choice
 
-    if obj is None:
-        return
+
+def _load_variable_reference(obj: dict, key: str) -> VariableReference:
+    return VariableReference(str(obj[key]))
+
+
+def _load_read_count_reference(obj: dict, key: str) -> VariableReference:
+    read_count_ref = VariableReference()
+    read_count_ref.path_string_for_count = str(obj[key])
+    return read_count_ref
+
+
+def _load_variable_assignment(obj: dict, key: str) -> VariableAssignment:
+    variable_name = str(obj[key])
+    is_new_declaration = not obj.get("re")
+    var_assign = VariableAssignment(variable_name, is_new_declaration)
+    var_assign.is_global = key == "VAR="
+    return var_assign
+
+
+# dict tokens are identified by a single signature key
+_dict_token_loaders: dict[str, t.Callable[[dict, str], InkObject]] = {
+    "^->": _load_divert_target_value,
+    "^var": _load_variable_pointer_value,
+    "->": Divert.from_token,
+    "f()": Divert.from_token,
+    "->t->": Divert.from_token,
+    "x()": Divert.from_token,
+    "*": _load_choice_point,
+    "VAR?": _load_variable_reference,
+    "CNT?": _load_read_count_reference,
+    "VAR=": _load_variable_assignment,
+    "temp=": _load_variable_assignment,
+}
+
+
+def _load_string_token(obj: str) -> InkObject:
+    # string values
+    if obj and obj[0] == "^":
+        return StringValue(obj[1:])
+
+    # newlines, glue, control commands and void
+    if factory := _string_token_factories.get(obj):
+        return factory()
+
+    raise RuntimeError(f"Failed to convert token to runtime object: '{obj}'")
+
+
+def _load_dict_token(obj: dict) -> InkObject:
+    # find the handler from the token's own keys, rather than probing the
+    # token once for every kind of object it might be
+    for key in obj:
+        if loader := _dict_token_loaders.get(key):
+            return loader(obj, key)
+
+    # TODO: legacy tag
+
+    # TODO: list value
 
     raise RuntimeError(f"Failed to convert token to runtime object: '{obj}'")
 
 
+# the remaining string tokens each map to a new object, they can't be shared as
+# every loaded object gets its own parent
+_string_token_factories: dict[str, t.Callable[[], InkObject]] = {
+    "\n": partial(StringValue, "\n"),
+    "<>": Glue,
+    "void": Void,
+    **{
+        name: partial(ControlCommand, type)
+        for name, type in ControlCommand.STRING_TO_COMMAND_TYPE.items()
+        if isinstance(name, str)
+    },
+}
+
+
+def _load_null_token(obj: None) -> None:
+    return
+
+
+# json only produces these exact types, so a token's type picks its loader
+_token_loaders: dict[type, t.Callable[[t.Any], InkObject | None]] = {
+    str: _load_string_token,
+    dict: _load_dict_token,
+    list: load_runtime_container,
+    bool: Value.create,
+    int: Value.create,
+    float: Value.create,
+    type(None): _load_null_token,
+}
+
+
+def load_runtime_object(obj) -> InkObject:
+    loader = _token_loaders.get(type(obj))
+
+    if loader is None:
+        # already built by the object hook while parsing
+        if isinstance(obj, InkObject):
+            return obj
+
+        raise RuntimeError(f"Failed to convert token to runtime object: '{obj}'")
+
+    # only log raw tokens, objects built by the hook can't be formatted until
+    # they have a parent, and containers are dumped as a whole once loaded
+    if loader is not load_runtime_container and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s", obj)
+
+    return loader(obj)
+
+
 def loads(s: str):
     return load(s)
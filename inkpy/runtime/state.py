@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import typing as t
 
 from .call_stack import CallStack, PushPopType
@@ -22,8 +23,35 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger("inkpy")
 
+_INLINE_WHITESPACE = re.compile(r"[ \t]+")
+_LINE_EDGE_WHITESPACE = re.compile(r"^[ \t]+|[ \t]+$", re.MULTILINE)
+
 
 class State:
+    __slots__ = (
+        "story",
+        "call_stack",
+        "current_errors",
+        "current_turn_index",
+        "current_warnings",
+        "did_safe_exit",
+        "diverted_pointer",
+        "evaluation_stack",
+        "named_flows",
+        "variables_state",
+        "_current_flow",
+        "_current_tags",
+        "_current_text",
+        "_output_stream_tags_dirty",
+        "_output_stream_text_dirty",
+        "_text_head",
+        "_text_in_tag",
+        "_text_parts",
+        "_text_parts_length",
+        "_turn_indices",
+        "_visit_counts",
+    )
+
     DEFAULT_FLOW_NAME = "DEFAULT_FLOW"
     INK_SAVE_STATE_VERSION = 10
     MIN_COMPATIBLE_LOAD_VERSION = 8
@@ -45,22 +73,22 @@ class State:
         self._current_text: str = ""
         self._output_stream_tags_dirty = False
         self._output_stream_text_dirty = False
-        self._turn_indices: dict[str, int] = {}
-        self._visit_counts: dict[str, int] = {}
+        # keyed on the containers themselves, which hash by identity, so there's no
+        # path to build or compare on lookup
+        self._turn_indices: dict[Container, int] = {}
+        self._visit_counts: dict[Container, int] = {}
 
         self.goto_start()
 
     def add_error(self, message):
         self.current_errors.append(message)
-        logger.error(message)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("%s", message)
 
     def add_warning(self, message):
         self.current_warnings.append(message)
-        logger.warning(message)
-
-    @property
-    def call_stack(self) -> CallStack:
-        return self.current_flow.call_stack
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("%s", message)
 
     @property
     def call_stack_depth(self) -> int:
@@ -68,55 +96,44 @@ class State:
 
     @property
     def can_continue(self) -> bool:
-        return bool(self.current_pointer and not self.has_error)
+        return bool(self.current_pointer and not self.current_errors)
 
     def _clean_output_whitespace(self, text: str) -> str:
-        output = ""
-
-        current_whitespace_start = -1
-        start_of_line = 0
-
-        for i, c in enumerate(text):
-            is_inline_whitespace = c in (" ", "\t")
-
-            if is_inline_whitespace and current_whitespace_start == -1:
-                current_whitespace_start = i
-
-            if not is_inline_whitespace:
-                if (
-                    c != "\n"
-                    and current_whitespace_start > 0
-                    and current_whitespace_start != start_of_line
-                ):
-                    output += " "
-                current_whitespace_start = -1
+        # drop inline whitespace at the start and end of lines, and collapse any
+        # other run of it to a single space
+        text = _LINE_EDGE_WHITESPACE.sub("", text)
 
-            if c == "\n":
-                start_of_line = i + 1
+        # usual prose only has single spaces, which the substitution would just
+        # replace one for one, and two substring searches are far cheaper
+        if "  " not in text and "\t" not in text:
+            return text
 
-            if not is_inline_whitespace:
-                output += c
-
-        return output
+        return _INLINE_WHITESPACE.sub(" ", text)
 
     def copy(self) -> "State":
-        state = State(self.story)
+        # everything __init__ would build is replaced from this state, so skip it
+        state = State.__new__(State)
+        state.story = self.story
+
+        flow = Flow(self.current_flow.name, self.story, self.call_stack.copy())
+        flow.output_stream.extend(self.output_stream)
+        state.current_flow = flow
 
-        state.current_flow = Flow(self.current_flow.name, self.story)
-        state.current_flow.call_stack = self.call_stack.copy()
         state.diverted_pointer = self.diverted_pointer
         state.previous_pointer = self.previous_pointer
 
-        state.current_errors.extend(self.current_errors)
-        state.current_warnings.extend(self.current_warnings)
+        state.current_errors = self.current_errors.copy()
+        state.current_warnings = self.current_warnings.copy()
 
-        state.output_stream.extend(self.output_stream)
+        state._current_tags = []
+        state._current_text = ""
         state.mark_output_stream_dirty()
 
         state.variables_state = self.variables_state
         state.variables_state.call_stack = state.call_stack
 
-        state.evaluation_stack.extend(self.evaluation_stack)
+        state.evaluation_stack = self.evaluation_stack.copy()
+        state.named_flows = {}
 
         state._visit_counts = self._visit_counts
         state._turn_indices = self._turn_indices
@@ -133,6 +150,17 @@ class State:
             return []
         return self.current_flow.current_choices
 
+    @property
+    def current_flow(self) -> Flow:
+        return self._current_flow
+
+    @current_flow.setter
+    def current_flow(self, value: Flow):
+        self._current_flow = value
+        # the call stack is used on every step, so don't go through the flow for it
+        self.call_stack: CallStack = value.call_stack
+        self._reset_text_parts()
+
     @property
     def current_flow_name(self) -> str:
         return self.current_flow.name
@@ -150,29 +178,35 @@ class State:
     @property
     def current_tags(self) -> list[str]:
         if self._output_stream_tags_dirty:
-            self._current_tags.clear()
+            tags = self._current_tags
+            tags.clear()
+
+            # looked up once here rather than for every item in the output stream
+            begin_tag = ControlCommand.CommandType.BeginTag
+            end_tag = ControlCommand.CommandType.EndTag
 
             text = []
             in_tag = False
             for content in self.output_stream:
-                if isinstance(content, ControlCommand):
-                    if content.type == ControlCommand.CommandType.BeginTag:
+                content_type = type(content)
+                if content_type is ControlCommand:
+                    if content.type is begin_tag:
                         if in_tag and text:
-                            self._current_tags.append("".join(text))
+                            tags.append("".join(text))
                             text.clear()
                         in_tag = True
-                    elif content.type == ControlCommand.CommandType.EndTag:
+                    elif content.type is end_tag:
                         if text:
-                            self._current_tags.append("".join(text))
+                            tags.append("".join(text))
                             text.clear()
                         in_tag = False
-                elif in_tag and isinstance(content, StringValue):
+                elif in_tag and content_type is StringValue:
                     text.append(content.value)
 
                 # TODO: handle Tag
 
             if text:
-                self._current_tags.append("".join(text))
+                tags.append("".join(text))
 
             self._output_stream_tags_dirty = False
 
@@ -181,20 +215,38 @@ class State:
     @property
     def current_text(self) -> str:
         if self._output_stream_text_dirty:
-            text = []
-
-            in_tag = False
-            for content in self.output_stream:
-                if not in_tag and isinstance(content, StringValue):
-                    text.append(content.value)
-                elif isinstance(content, ControlCommand):
-                    if content.type == ControlCommand.CommandType.BeginTag:
+            output_stream = self.output_stream
+
+            begin_tag = ControlCommand.CommandType.BeginTag
+            end_tag = ControlCommand.CommandType.EndTag
+
+            # text from earlier content is kept, only look at what's been pushed since
+            text = self._text_parts
+            in_tag = self._text_in_tag
+            for content in output_stream[self._text_parts_length :]:
+                content_type = type(content)
+                if content_type is StringValue:
+                    if not in_tag:
+                        text.append(content.value)
+                elif content_type is ControlCommand:
+                    if content.type is begin_tag:
                         in_tag = True
-                    elif content.type == ControlCommand.CommandType.EndTag:
+                    elif content.type is end_tag:
                         in_tag = False
 
-            # TODO: clean output whitespace
-            self._current_text = self._clean_output_whitespace("".join(text))
+            self._text_in_tag = in_tag
+            self._text_parts_length = len(output_stream)
+
+            # cleaning never looks past a newline, so finished lines are cleaned
+            # once into the head and only the last, open line is cleaned each time
+            tail = "".join(text)
+            newline = tail.rfind("\n") + 1
+            if newline:
+                self._text_head += self._clean_output_whitespace(tail[:newline])
+                tail = tail[newline:]
+            text[:] = (tail,)
+
+            self._current_text = self._text_head + self._clean_output_whitespace(tail)
             self._output_stream_text_dirty = False
 
         return self._current_text
@@ -216,13 +268,13 @@ class State:
 
     @property
     def has_error(self) -> bool:
-        return len(self.current_errors) > 0
+        return bool(self.current_errors)
 
     has_errors = has_error
 
     @property
     def has_warning(self) -> bool:
-        return len(self.current_warnings) > 0
+        return bool(self.current_warnings)
 
     has_warnings = has_warning
 
@@ -248,30 +300,50 @@ class State:
 
     @property
     def output_stream_contains_content(self) -> bool:
-        return any(isinstance(c, StringValue) for c in self.output_stream)
+        return any(type(c) is StringValue for c in self.output_stream)
 
     @property
     def output_stream_ends_in_newline(self) -> bool:
-        for output in reversed(self.output_stream):
-            # if not isinstance(output, ControlCommand):
-            #     break
-            if isinstance(output, StringValue):
+        output_stream = self.output_stream
+
+        # usually settled by the last item or two, so index back from the end
+        for i in range(len(output_stream) - 1, -1, -1):
+            output = output_stream[i]
+            if type(output) is StringValue:
                 if output.is_newline:
                     return True
                 elif output.is_non_whitespace:
-                    break
+                    return False
 
         return False
 
     def pass_arguments_to_evaluation_stack(self, args: list):
+        create = Value.create
+        push = self.push_evaluation_stack
+
         for arg in args:
             # TODO: check types
 
-            self.push_evaluation_stack(Value.create(arg))
+            push(create(arg))
 
     def peek_evaluation_stack(self) -> InkObject:
         return self.evaluation_stack[-1]
 
+    def pop_from_output_stream(self) -> InkObject:
+        content = self.output_stream.pop()
+
+        # the popped content may already be in the text parts, so start them over
+        # unless it couldn't have added anything to them (e.g. glue)
+        if self._text_parts_length > len(self.output_stream):
+            if type(content) in (ControlCommand, StringValue):
+                self._reset_text_parts()
+            else:
+                self._text_parts_length = len(self.output_stream)
+
+        self.mark_output_stream_dirty()
+
+        return content
+
     def pop_callstack(self, type: PushPopType | None = None):
         # TODO: trim whitepsace from function end
 
@@ -296,24 +368,23 @@ class State:
     def push_to_output_stream(self, content: InkObject):
         include_in_output = True
 
-        if isinstance(content, StringValue):
-            if content.is_newline:
-                if self.output_stream and isinstance(self.output_stream[-1], Glue):
-                    include_in_output = False
-                    self.output_stream.pop()
-                    self.mark_output_stream_dirty()
-                elif (
-                    self.call_stack.current_element.function_start_in_output_stream > -1
-                ):
-                    include_in_output = False
-                elif not self.output_stream_contains_content:
-                    include_in_output = False
-            elif not content.is_newline:
-                content = StringValue(content.value)
+        # string values are never changed once pushed, so they go in as they are
+        # rather than as a copy. the output types are leaf classes, so compare
+        # type() directly rather than walk the mro with isinstance
+        if type(content) is StringValue and content.is_newline:
+            if self.output_stream and type(self.output_stream[-1]) is Glue:
+                include_in_output = False
+                self.pop_from_output_stream()
+            elif self.call_stack.current_element.function_start_in_output_stream > -1:
+                include_in_output = False
+            elif not self.output_stream_contains_content:
+                include_in_output = False
 
         if include_in_output:
             self.output_stream.append(content)
-            self.mark_output_stream_dirty()
+            # mark_output_stream_dirty(), inlined as this runs for every output
+            self._output_stream_tags_dirty = True
+            self._output_stream_text_dirty = True
 
     def reset_errors(self):
         self.current_errors.clear()
@@ -323,6 +394,15 @@ class State:
         if content:
             self.output_stream.extend(content)
 
+        self._reset_text_parts()
+        self.mark_output_stream_dirty()
+
+    def _reset_text_parts(self):
+        self._text_head = ""
+        self._text_parts: list[str] = []
+        self._text_parts_length = 0
+        self._text_in_tag = False
+
     def reset_warnings(self):
         self.current_warnings.clear()
 
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-import json
 import logging
 import typing as t
 
-from collections import defaultdict
-
 from . import serialisation, typing
 from .call_stack import PushPopType
 from .choice import Choice
@@ -28,6 +25,9 @@ from .void import Void
 
 logger = logging.getLogger("inkpy")
 
+# saves two attribute lookups on every command type comparison
+CommandType = ControlCommand.CommandType
+
 
 class Story(InkObject):
     INK_VERSION_CURRENT = 21
@@ -41,7 +41,7 @@ class Story(InkObject):
         self._evaluation_content_container: Container | None = None
         self._externals: dict[str, ExternalFunction] = {}
         self._has_validated_externals = False
-        self._observers: dict[str, list[typing.Observer]] = defaultdict(list)
+        self._observers: dict[str, list[typing.Observer]] = {}
         self._on_did_continue: typing.DidContinueHandler | None = None
         self._on_choose_path_string: typing.ChoosePathStringHandler | None = None
         self._on_error: typing.ErrorHandler | None = None
@@ -54,11 +54,13 @@ class Story(InkObject):
 
     def _add_error(self, message):
         self.state.current_errors.append(message)
-        logger.error(message)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("%s", message)
 
     def _add_warning(self, message):
         self.state.current_warnings.append(message)
-        logger.warning(message)
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("%s", message)
 
     def _assert(condition: bool, message: str):
         if not condition:
@@ -87,7 +89,7 @@ class Story(InkObject):
         # if self._on_make_choice:
         #     self._on_make_choice(choice)
 
-        self.state.call_stack.current_thread = choice.thread_at_generation
+        self.state.call_stack.set_current_thread(choice.thread_at_generation)
 
         self.choose_path(choice.target_path)
 
@@ -290,7 +292,8 @@ class Story(InkObject):
     def _next_content(self):
         # divert, if applicable
         if self.state.diverted_pointer:
-            self.state.current_pointer = self.state.diverted_pointer.copy()
+            # pointers aren't changed in place, so the divert target can be shared
+            self.state.current_pointer = self.state.diverted_pointer
             self.state.diverted_pointer = None
 
             self.visit_changed_containers_due_to_divert()
@@ -303,31 +306,32 @@ class Story(InkObject):
         if self.state.current_pointer:
             successful_increment = True
 
-            pointer = self.state.current_pointer.copy()
-            pointer.index += 1
+            # walk up with plain locals and only build the pointer we end up at
+            container = self.state.current_pointer.container
+            index = self.state.current_pointer.index + 1
 
             # check if past end of content, then return to the ancestor container
-            while pointer.index >= len(pointer.container.content):
+            while index >= len(container.content):
                 successful_increment = False
 
-                ancestor = pointer.container.parent
+                ancestor = container.parent
 
                 if not ancestor:
                     break
 
                 try:
-                    index = ancestor.content.index(pointer.container)
-                except IndexError:
+                    index = ancestor.index_of(container) + 1
+                except ValueError:
                     break
 
-                pointer = Pointer(ancestor, index + 1)
+                container = ancestor
 
                 successful_increment = True
 
-            if not successful_increment:
-                pointer = None
-
-            self.state.current_pointer = pointer
+            if successful_increment:
+                self.state.current_pointer = Pointer(container, index)
+            else:
+                self.state.current_pointer = None
         else:
             successful_increment = False
 
@@ -419,7 +423,7 @@ class Story(InkObject):
         # return to the content after instruction
         if (
             isinstance(content, ControlCommand)
-            and content.type == ControlCommand.CommandType.StartThread
+            and content.type is CommandType.StartThread
         ):
             self.state.call_stack.push_thread()
 
@@ -475,28 +479,35 @@ class Story(InkObject):
             return True
 
         elif isinstance(content, ControlCommand):
-            if content.type == ControlCommand.CommandType.EvalStart:
+            command_type = content.type
+
+            if command_type is CommandType.EvalStart:
                 assert not self.state.in_expression_evaluation
                 self.state.in_expression_evaluation = True
-            elif content.type == ControlCommand.CommandType.EvalEnd:
+            elif command_type is CommandType.EvalEnd:
                 assert self.state.in_expression_evaluation
                 self.state.in_expression_evaluation = False
-            elif content.type == ControlCommand.CommandType.EvalOutput:
+            elif command_type is CommandType.EvalOutput:
                 if len(self.state.evaluation_stack) > 0:
                     output = self.state.pop_evaluation_stack()
 
                     # functions may evaluation to void
                     if not isinstance(output, Void):
-                        text = StringValue(str(output))
+                        # values aren't changed once created, so strings (newlines
+                        # included) can go to the output as they are
+                        if isinstance(output, StringValue):
+                            text = output
+                        else:
+                            text = StringValue(str(output))
 
                         self.state.push_to_output_stream(text)
-            elif content.type == ControlCommand.CommandType.NoOp:
+            elif command_type is CommandType.NoOp:
                 pass
-            elif content.type == ControlCommand.CommandType.Duplicate:
+            elif command_type is CommandType.Duplicate:
                 self.state.push_evaluation_stack(self.state.peek_evaluation_stack())
-            elif content.type == ControlCommand.CommandType.PopEvaluatedValue:
+            elif command_type is CommandType.PopEvaluatedValue:
                 self.state.pop_evaluation_stack()
-            elif content.type == ControlCommand.CommandType.PopFunction:
+            elif command_type is CommandType.PopFunction:
                 type = PushPopType.Function
 
                 if self.state.try_exit_function_evaluation_from_game():
@@ -512,7 +523,7 @@ class Story(InkObject):
                     self._add_error(message)
                 else:
                     self.state.pop_callstack()
-            elif content.type == ControlCommand.CommandType.PopTunnel:
+            elif command_type is CommandType.PopTunnel:
                 type = PushPopType.Tunnel
 
                 value = self.state.pop_evaluation_stack()
@@ -543,14 +554,14 @@ class Story(InkObject):
                             override_tunnel_return_target.target_path
                         )
 
-            elif content.type == ControlCommand.CommandType.Done:
+            elif command_type is CommandType.Done:
                 if self.state.call_stack.can_pop_thread:
                     self.state.call_stack.pop_thread()
                 else:
                     self.state.did_safe_exit = True
                     self.state.current_pointer = None
 
-            elif content.type == ControlCommand.CommandType.BeginString:
+            elif command_type is CommandType.BeginString:
                 self.state.push_to_output_stream(content)
 
                 assert (
@@ -558,19 +569,19 @@ class Story(InkObject):
                 ), "Expected to be in an expression when evaluating a string"
                 self.state.in_expression_evaluation = False
 
-            elif content.type == ControlCommand.CommandType.BeginTag:
+            elif command_type is CommandType.BeginTag:
                 self.state.push_to_output_stream(content)
 
-            elif content.type == ControlCommand.CommandType.EndString:
+            elif command_type is CommandType.EndString:
                 content_for_string = []
                 content_to_retain = []
 
                 while self.state.output_stream:
-                    o = self.state.output_stream.pop()
+                    o = self.state.pop_from_output_stream()
 
                     if (
                         isinstance(o, ControlCommand)
-                        and o.type == ControlCommand.CommandType.BeginString
+                        and o.type is CommandType.BeginString
                     ):
                         break
 
@@ -587,17 +598,17 @@ class Story(InkObject):
                 self.state.in_expression_evaluation = True
                 self.state.push_evaluation_stack(value)
 
-            elif content.type == ControlCommand.CommandType.EndTag:
+            elif command_type is CommandType.EndTag:
                 if self.state.in_string_evaluation:
                     raise NotImplementedError()
                 else:
                     self.state.push_to_output_stream(content)
 
-            elif content.type == ControlCommand.CommandType.End:
+            elif command_type is CommandType.End:
                 self.state.force_end()
 
             else:
-                raise NotImplementedError(content.type)
+                raise NotImplementedError(command_type)
 
             return True
 
@@ -672,7 +683,7 @@ class Story(InkObject):
 
         choice = Choice()
         choice.target_path = choice_point.path_on_choice
-        choice.source_path = str(choice_point.path)
+        choice.source_path = choice_point.path_string
         choice.is_invisible_default = choice_point.is_invisible_default
         choice.tags = choice_only_tags + start_tags
         choice.thread_at_generation = self.state.call_stack.fork_thread()
@@ -757,44 +768,7 @@ class Story(InkObject):
         return truthy
 
     def load(self, data: str | t.TextIO):
-        if isinstance(data, str):
-            data = json.loads(data)
-        else:
-            data = json.load(data)
-
-        try:
-            version = int(data["inkVersion"])
-        except KeyError:
-            raise ValueError("Version of ink could not be found")
-        except ValueError:
-            raise ValueError(
-                f"Version of ink value was malformed: {data['inkVersion']!r}"
-            )
-
-        if version > self.INK_VERSION_CURRENT:
-            raise RuntimeError(
-                "Version of ink used to build story was newer than the current version "
-                "of the loader"
-            )
-        elif version < self.INK_VERSION_MINIMUM_COMPATIBLE:
-            raise RuntimeError(
-                "Version of ink used to build story is too old to be loaded by this "
-                "version of the loader"
-            )
-        elif version != self.INK_VERSION_CURRENT:
-            logger.warning(
-                "Version of ink used to build story doesn't match current version of "
-                "loader. Non-critical, but recommend synchronising.",
-            )
-
-        logger.debug("Loading ink runtime with version %s", version)
-
-        if "root" not in data:
-            raise ValueError("Root node for ink not found")
-
-        root = serialisation.load_runtime_container(data["root"])
-
-        list_defs = data.get("listDefs")
+        root, list_defs = serialisation.load(data)
 
         self._main_content_container = root
 
@@ -819,7 +793,7 @@ class Story(InkObject):
                     "the story"
                 )
 
-            self._observers[name].append(f)
+            self._observers.setdefault(name, []).append(f)
             return f
 
         return f and decorator(f) or decorator
@@ -949,9 +923,9 @@ class Story(InkObject):
 
         for content in container.content:
             if isinstance(content, ControlCommand):
-                if content.type == ControlCommand.CommandType.BeginTag:
+                if content.type is CommandType.BeginTag:
                     in_tag = True
-                elif content.type == ControlCommand.CommandType.EndTag:
+                elif content.type is CommandType.EndTag:
                     in_tag = False
 
             # gather all tags
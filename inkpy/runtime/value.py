@@ -61,6 +61,11 @@ class Value(InkObject, metaclass=ABCMeta):
 
     @staticmethod
     def create(value) -> "Value":
+        # exact builtin types are by far the common case, subclasses fall through
+        value_type = _value_types.get(type(value))
+        if value_type is not None:
+            return value_type(value)
+
         if isinstance(value, bool):
             return BoolValue(value)
         elif isinstance(value, float):
@@ -223,3 +228,11 @@ class VariablePointerValue(Value):
     @variable_name.setter
     def variable_name(self, value: str):
         self.value = value
+
+
+_value_types: dict[type, type[Value]] = {
+    bool: BoolValue,
+    float: FloatValue,
+    int: IntValue,
+    str: StringValue,
+}
@@ -26,4 +26,4 @@ class VariableReference(InkObject):
         if value is None:
             self.path_for_count = None
         else:
-            self.path_for_count = value
+            self.path_for_count = Path(value)
@@ -125,8 +125,9 @@ class VariablesState:
     def _on_variable_changed(self, name: str, value: Value):
         if self._batch_observing_variable_changes:
             self._changed_variables_for_batch.add(name)
-        else:
-            for observer in self.story._observers[name]:
+        elif self.story._observers:
+            # only observed variables have an entry, most stories have none at all
+            for observer in self.story._observers.get(name, ()):
                 observer(name, value)
 
     def resolve_variable_pointer(self, pointer) -> Value:
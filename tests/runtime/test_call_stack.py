@@ -0,0 +1,40 @@
+from inkpy.runtime.call_stack import CallStack, PushPopType
+from inkpy.runtime.container import Container
+from inkpy.runtime.story import Story
+
+
+def make_call_stack():
+    story = Story()
+    story._main_content_container = Container()
+
+    return CallStack(story)
+
+
+def test_current_element():
+    call_stack = make_call_stack()
+    root_element = call_stack.current_element
+
+    call_stack.push(PushPopType.Function)
+    assert call_stack.current_element is not root_element
+    assert call_stack.current_element.type == PushPopType.Function
+
+    call_stack.pop(PushPopType.Function)
+    assert call_stack.current_element is root_element
+
+
+def test_current_element_copy():
+    call_stack = make_call_stack()
+    call_stack.push(PushPopType.Tunnel)
+
+    copy = call_stack.copy()
+    assert copy.current_thread is copy.threads[-1]
+    assert copy.current_element is copy.threads[-1].callstack[-1]
+
+
+def test_set_current_thread():
+    call_stack = make_call_stack()
+    thread = call_stack.fork_thread()
+
+    call_stack.set_current_thread(thread)
+    assert call_stack.current_thread is thread
+    assert call_stack.current_element is thread.callstack[-1]
@@ -0,0 +1,47 @@
+import pytest
+
+from inkpy.runtime.container import Container
+from inkpy.runtime.glue import Glue
+
+
+def test_index_of():
+    container = Container()
+    first = Glue()
+    container.add_content(first)
+
+    assert container.index_of(first) == 0
+
+    second = Glue()
+    container.add_content(second)
+
+    assert container.index_of(first) == 0
+    assert container.index_of(second) == 1
+
+
+def test_index_of_missing():
+    container = Container()
+    container.add_content(Glue())
+
+    with pytest.raises(ValueError):
+        container.index_of(Glue())
+
+
+def test_dump_string_hierachy():
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    glue = Glue()
+    foo.add_content(glue)
+    root.add_content(Glue())
+
+    assert root.dump_string_hierachy(foo) == "\n".join(
+        [
+            "[",
+            "  [ (foo) <---",
+            "    Glue",
+            "  ]",
+            "  Glue",
+            "-- named: --",
+            "]",
+        ]
+    )
@@ -0,0 +1,20 @@
+from inkpy.runtime.call_stack import PushPopType
+from inkpy.runtime.divert import Divert
+
+
+def test_from_token():
+    divert1 = Divert.from_token({"->t->": "foo", "c": True})
+    assert divert1.pushes_to_stack is True
+    assert divert1.stack_push_type == PushPopType.Tunnel
+    assert divert1.is_external is False
+    assert divert1.is_conditional is True
+    assert divert1.target_path_string == "foo"
+
+    divert2 = Divert.from_token({"x()": "bar", "exArgs": 2})
+    assert divert2.pushes_to_stack is False
+    assert divert2.is_external is True
+    assert divert2.external_args == 2
+
+    divert3 = Divert.from_token({"->": "baz", "var": True})
+    assert divert3.has_variable_target
+    assert divert3.variable_divert_name == "baz"
@@ -1,5 +1,7 @@
 import pytest
 
+from inkpy.runtime.story import Story
+
 
 @pytest.fixture(scope="module")
 def testdir(datadir):
@@ -64,3 +66,15 @@ def test_complex_tunnels(compile_story):
 #         story = Story(f)
 
 #     assert story.continue_() == "This is A\nNow in B.\n"
+
+
+def test_divert_into_named_content():
+    # knot.0.bar and knot.0.baz are named-only content, bar diverts relatively
+    story = Story(
+        '{"inkVersion":21,"root":[{"->":"knot.0.bar.1"},"done",{"knot":[["^x",'
+        '{"bar":["^x","^Hello","\\n",{"->":".^.^.baz.1"},null],'
+        '"baz":["^x","^world","\\n","done",null]}],null]}]}'
+    )
+
+    assert "".join(story.continue_maximally()) == "Hello\nworld\n"
+    assert not story.has_error
@@ -0,0 +1,127 @@
+from inkpy.runtime.container import Container
+from inkpy.runtime.glue import Glue
+from inkpy.runtime.path import Path
+
+
+def test_path():
+    root = Container()
+    root.add_content(Glue())
+    container = Container("foo")
+    root.add_content(container)
+    glue = Glue()
+    container.add_content(glue)
+
+    assert str(glue.path) == "foo.0"
+
+
+def test_path_invalidated_on_parent():
+    glue = Glue()
+    assert len(glue.path) == 0
+
+    container = Container()
+    container.add_content(Glue())
+    container.add_content(glue)
+
+    assert len(glue.path) == 1
+    assert glue.path[0].index == 1
+
+
+def test_convert_path_to_relative():
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    bar = Container("bar")
+    foo.add_content(bar)
+    glue = Glue()
+    bar.add_content(glue)
+
+    relative_path = glue.convert_path_to_relative(Path("foo.baz.0"))
+    assert relative_path.is_relative
+    assert str(relative_path) == ".^.^.baz.0"
+
+    assert glue.convert_path_to_relative(Path("baz")) == Path("baz")
+
+
+def test_compact_path_string():
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    bar = Container("bar")
+    foo.add_content(bar)
+    glue = Glue()
+    bar.add_content(glue)
+
+    assert glue.compact_path_string(Path("foo.bar.baz.qux.0")) == ".^.baz.qux.0"
+    assert glue.compact_path_string(Path("foo.baz")) == "foo.baz"
+
+
+def test_path_string():
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    glue = Glue()
+    foo.add_content(glue)
+
+    assert glue.path_string == "foo.0"
+    assert glue.path_string is glue.path_string
+
+
+def test_path_from_parent_path():
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    foo.add_content(Glue())
+    glue = Glue()
+    foo.add_content(glue)
+
+    assert str(foo.path) == "foo"
+    assert glue.path == Path("foo", 1)
+
+
+def test_compact_path_string_deep():
+    root = container = Container()
+    for name in ("a", "b", "c", "d"):
+        child = Container(name)
+        container.add_content(child)
+        container = child
+    glue = Glue()
+    container.add_content(glue)
+
+    assert glue.compact_path_string(Path("x")) == "x"
+    assert glue.compact_path_string(Path("a.b.c.d.e")) == ".^.e"
+    assert root.compact_path_string(Path("a")) == "a"
+
+
+def test_root_content_container():
+    glue = Glue()
+    assert glue.root_content_container is glue
+
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    foo.add_content(glue)
+
+    assert glue.root_content_container is root
+    assert foo.root_content_container is root
+
+
+def test_path_invalidated_on_ancestor_parent():
+    foo = Container("foo")
+    bar = Container("bar")
+    foo.add_content(bar)
+    glue = Glue()
+    bar.add_content(glue)
+
+    assert str(glue.path) == "bar.0"
+    assert glue.path_string == "bar.0"
+    assert str(bar.index_path(0)) == "bar.0"
+    assert glue.root_content_container is foo
+
+    root = Container()
+    root.add_content(Glue())
+    root.add_content(foo)
+
+    assert str(glue.path) == "foo.bar.0"
+    assert glue.path_string == "foo.bar.0"
+    assert str(bar.index_path(0)) == "foo.bar.0"
+    assert glue.root_content_container is root
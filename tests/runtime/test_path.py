@@ -0,0 +1,95 @@
+import pytest
+
+from inkpy.runtime.path import Path
+
+
+def test_component_interned():
+    assert Path.Component(0) is Path.Component(0)
+    assert Path.Component(Path.PARENT_ID) is Path.Component.parent()
+    assert Path.Component("foo") is not Path.Component("foo")
+    assert Path.Component("foo") == Path.Component("foo")
+
+
+def test_component_interned_not_reinitialised():
+    component = Path.Component(3)
+    component.is_parent = True
+
+    try:
+        assert Path.Component(3) is component
+        assert component.is_parent
+    finally:
+        component.is_parent = False
+
+
+def test_component_bool():
+    with pytest.raises(TypeError):
+        Path.Component(True)
+
+    with pytest.raises(TypeError):
+        Path("foo", False)
+
+
+def test_component_parent():
+    component = Path.Component.parent()
+    assert component.is_parent
+    assert not component.is_index
+
+
+def test_path_from_string():
+    path = Path("foo.bar.^")
+    assert not path.is_relative
+    assert [str(c) for c in path] == ["foo", "bar", "^"]
+    assert path[2].is_parent
+
+    path = Path(".^.foo")
+    assert path.is_relative
+    assert [str(c) for c in path] == ["^", "foo"]
+
+    assert Path("foo.bar") == Path("foo.bar")
+
+    path = Path("foo.12")
+    assert path[1].is_index
+    assert path[1].index == 12
+
+
+def test_path_by_appending_path():
+    path = Path("foo.bar.baz")
+
+    assert path.path_by_appending_path(Path(".qux")) == Path("foo.bar.baz.qux")
+    assert path.path_by_appending_path(Path(".^.qux")) == Path("foo.bar.qux")
+    assert path.path_by_appending_path(Path(".^.^.^.qux")) == Path("qux")
+    assert path / Path(".^.^.qux.0") == Path("foo.qux.0")
+    assert path / Path(".^.^.^.^.qux") == Path("qux")
+
+
+def test_path_str():
+    assert str(Path("foo.bar.0")) == "foo.bar.0"
+    assert str(Path(".^.foo")) == ".^.foo"
+    assert str(Path()) == ""
+
+
+def test_path_hash():
+    assert hash(Path("foo.bar")) == hash(Path("foo.bar"))
+    assert {Path("foo.bar"): 1}[Path("foo.bar")] == 1
+
+
+def test_path_eq():
+    assert Path("foo", 0) == Path("foo", 0)
+    assert Path("foo", 0) == Path("foo.0")
+    assert hash(Path("foo", 0)) == hash(Path("foo.0"))
+    assert Path(".foo") != Path("foo")
+    assert Path("foo") != "foo"
+
+
+def test_path_self():
+    assert Path.self() is Path.self()
+    assert Path.self().is_relative
+    assert len(Path.self()) == 0
+    assert Path("foo").tail is Path.self()
+
+
+def test_path_tail():
+    tail = Path("foo", "bar", 0).tail
+
+    assert tail == Path("bar", 0)
+    assert not tail.is_relative
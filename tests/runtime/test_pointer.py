@@ -0,0 +1,33 @@
+from inkpy.runtime.container import Container
+from inkpy.runtime.glue import Glue
+from inkpy.runtime.path import Path
+from inkpy.runtime.pointer import Pointer
+
+
+def test_path():
+    root = Container()
+    foo = Container("foo")
+    root.add_content(foo)
+    foo.add_content(Glue())
+
+    assert Pointer().path is None
+    assert Pointer(foo).path is foo.path
+    assert Pointer(foo, 0).path == Path("foo", 0)
+    assert Pointer(foo, 0).path is Pointer(foo, 0).path
+
+
+def test_slots():
+    pointer = Pointer()
+
+    assert not hasattr(pointer, "__dict__")
+
+
+def test_resolve():
+    container = Container()
+    glue = Glue()
+    container.add_content(glue)
+
+    assert Pointer().resolve() is None
+    assert Pointer(container).resolve() is container
+    assert Pointer(container, 0).resolve() is glue
+    assert Pointer(container, 1).resolve() is None
@@ -0,0 +1,18 @@
+from inkpy.runtime.container import Container
+from inkpy.runtime.glue import Glue
+from inkpy.runtime.search_result import SearchResult
+
+
+def test_container():
+    container = Container()
+
+    assert SearchResult(content=container).container is container
+    assert SearchResult(content=Glue()).container is None
+    assert SearchResult().container is None
+
+
+def test_correct_content():
+    glue = Glue()
+
+    assert SearchResult(content=glue).correct_content is glue
+    assert SearchResult(approximate=True, content=glue).correct_content is None
@@ -7,6 +7,7 @@ from inkpy.runtime.container import Container
 from inkpy.runtime.divert import Divert
 from inkpy.runtime.story import Story
 from inkpy.runtime.value import BoolValue, FloatValue, IntValue, StringValue
+from inkpy.runtime.variable_assignment import VariableAssignment
 from inkpy.runtime.void import Void
 
 
@@ -127,6 +128,14 @@ def test_dump_runtime_object_string_value():
     assert obj == "^test string"
 
 
+def test_dump_runtime_object_subclass():
+    class TestContainer(Container):
+        pass
+
+    obj = serialisation.dump_runtime_object(TestContainer())
+    assert obj == []
+
+
 def test_dump_runtime_object_unknown():
     with pytest.raises(RuntimeError, match="Failed to convert runtime object to token"):
         serialisation.dump_runtime_object(object)
@@ -235,6 +244,24 @@ def test_load_runtime_container_named():
     assert len(obj.named_content) == 0
 
 
+def test_load_runtime_container_nested():
+    obj = serialisation.load_runtime_container(
+        [[["^a", {"#n": "baz"}], "^b", {"#n": "bar"}], "^c", {"qux": ["^d", None]}]
+    )
+    assert isinstance(obj, Container)
+    assert len(obj.content) == 2
+    assert obj.content[1].value == "c"
+
+    bar = obj.content[0]
+    assert bar.name == "bar"
+    assert obj.named_content["bar"] is bar
+    assert bar.named_content["baz"] is bar.content[0]
+    assert bar.content[0].content[0].value == "a"
+    assert bar.content[1].value == "b"
+
+    assert obj.named_content["qux"].content[0].value == "d"
+
+
 def test_load_runtime_container_with_content():
     obj = serialisation.load_runtime_container([[], None])
     assert isinstance(obj, Container)
@@ -250,11 +277,16 @@ def test_load_runtime_container_with_named_content():
 
 
 def test_load_runtime_container_with_named_content_only():
-    obj = serialisation.load_runtime_container([{"bar": [{"#n": "bar"}]}])
+    obj = serialisation.load_runtime_container([{"bar": ["^baz", None]}])
     assert isinstance(obj, Container)
     assert len(obj.content) == 0
     assert len(obj.named_only_content) == 1
 
+    bar = obj.named_content["bar"]
+    assert bar.parent is obj
+    assert bar.name == "bar"
+    assert str(bar.content[0].path) == "bar.0"
+
 
 def test_load_runtime_object_bool_value():
     obj1 = serialisation.load_runtime_object(True)
@@ -350,6 +382,20 @@ def test_load_runtime_object_unknown():
         serialisation.load_runtime_object("")
 
 
+def test_load_runtime_object_variable_assignment():
+    obj1 = serialisation.load_runtime_object({"VAR=": "foo", "re": True})
+    assert isinstance(obj1, VariableAssignment)
+    assert obj1.variable_name == "foo"
+    assert obj1.is_global is True
+    assert obj1.is_new_declaration is False
+
+    obj2 = serialisation.load_runtime_object({"temp=": "bar"})
+    assert isinstance(obj2, VariableAssignment)
+    assert obj2.variable_name == "bar"
+    assert obj2.is_global is False
+    assert obj2.is_new_declaration is True
+
+
 def test_load_runtime_object_void():
     obj = serialisation.load_runtime_object("void")
     assert isinstance(obj, Void)
@@ -359,3 +405,33 @@ def test_loads(story_json):
     root, _ = serialisation.loads(story_json)
     assert isinstance(root, Container)
     assert len(root.content) == 0
+
+
+def test_loads_tokens():
+    root, _ = serialisation.loads(
+        '{"inkVersion":21,"root":[{"->":"foo"},{"foo":["^bar",{"#f":1}]}]}'
+    )
+    assert isinstance(root.content[0], Divert)
+    assert root.content[0].target_path_string == "foo"
+    assert root.named_content["foo"].content[0].value == "bar"
+    assert root.named_content["foo"].flags == 1
+
+
+def test_loads_debug_logging(caplog):
+    with caplog.at_level(logging.DEBUG, logger=serialisation.logger.name):
+        root, _ = serialisation.loads(
+            '{"inkVersion":21,"root":[{"->":".^.foo"},{"foo":["^bar",null]}]}'
+        )
+
+    assert isinstance(root.content[0], Divert)
+    assert "^bar" in caplog.text
+
+
+def test_dumps_named_only_content(story):
+    story_json = (
+        '{"inkVersion":21,"root":["^foo",'
+        '{"bar":[["^baz",{"qux":["^quux",null],"#n":"x"}],{"#f":1}]}]}'
+    )
+
+    story._main_content_container, _ = serialisation.loads(story_json)
+    assert serialisation.dumps(story) == story_json
@@ -0,0 +1,182 @@
+import pytest
+
+from inkpy.runtime.container import Container
+from inkpy.runtime.control_command import ControlCommand
+from inkpy.runtime.glue import Glue
+from inkpy.runtime.state import State
+from inkpy.runtime.story import Story
+from inkpy.runtime.value import StringValue
+
+
+@pytest.fixture
+def state():
+    story = Story()
+    story._main_content_container = Container()
+
+    return State(story)
+
+
+def test_current_tags(state):
+    begin_tag = ControlCommand.CommandType.BeginTag
+    end_tag = ControlCommand.CommandType.EndTag
+
+    state.push_to_output_stream(StringValue("Hello"))
+    state.push_to_output_stream(ControlCommand(begin_tag))
+    state.push_to_output_stream(StringValue("foo"))
+    state.push_to_output_stream(ControlCommand(end_tag))
+    state.push_to_output_stream(ControlCommand(begin_tag))
+    state.push_to_output_stream(StringValue("bar"))
+    state.push_to_output_stream(StringValue("baz"))
+    state.push_to_output_stream(ControlCommand(end_tag))
+
+    assert state.current_tags == ["foo", "barbaz"]
+
+
+def test_current_text(state):
+    state.push_to_output_stream(StringValue("Hello"))
+    assert state.current_text == "Hello"
+
+    state.push_to_output_stream(ControlCommand(ControlCommand.CommandType.BeginTag))
+    state.push_to_output_stream(StringValue("tag"))
+    state.push_to_output_stream(ControlCommand(ControlCommand.CommandType.EndTag))
+    state.push_to_output_stream(StringValue(" world"))
+    assert state.current_text == "Hello world"
+
+    state.push_to_output_stream(Glue())
+    assert state.current_text == "Hello world"
+
+    state.push_to_output_stream(StringValue("\n"))
+    assert state.current_text == "Hello world"
+
+
+def test_current_text_after_pop(state):
+    state.push_to_output_stream(StringValue("Hello"))
+    state.push_to_output_stream(StringValue(" world"))
+    assert state.current_text == "Hello world"
+
+    state.pop_from_output_stream()
+    assert state.current_text == "Hello"
+
+
+def test_current_text_after_reset(state):
+    state.push_to_output_stream(StringValue("Hello"))
+    assert state.current_text == "Hello"
+
+    state.reset_output([StringValue("Goodbye")])
+    assert state.current_text == "Goodbye"
+
+
+def test_copy(state):
+    state.push_to_output_stream(StringValue("Hello"))
+    state.add_warning("warning")
+
+    copy = state.copy()
+    assert copy.current_text == "Hello"
+    assert copy.current_warnings == ["warning"]
+    assert copy.call_stack is not state.call_stack
+    assert copy.variables_state.call_stack is copy.call_stack
+
+    copy.push_to_output_stream(StringValue(" world"))
+    assert copy.current_text == "Hello world"
+    assert state.current_text == "Hello"
+
+
+def test_copy_does_not_grow_source(state):
+    state.add_error("error")
+    state.add_warning("warning")
+
+    for _ in range(100):
+        copy = state.copy()
+
+    assert state.current_errors == ["error"]
+    assert state.current_warnings == ["warning"]
+    assert copy.current_errors == ["error"]
+
+    copy.add_error("another error")
+    assert state.current_errors == ["error"]
+
+
+def test_output_stream_ends_in_newline(state):
+    assert not state.output_stream_ends_in_newline
+
+    state.push_to_output_stream(StringValue("Hello"))
+    state.push_to_output_stream(StringValue("\n"))
+    assert state.output_stream_ends_in_newline
+
+    state.push_to_output_stream(StringValue(" "))
+    assert state.output_stream_ends_in_newline
+
+    state.push_to_output_stream(StringValue("world"))
+    assert not state.output_stream_ends_in_newline
+
+
+def test_slots(state):
+    assert not hasattr(state, "__dict__")
+    assert not hasattr(state.current_flow, "__dict__")
+    assert not hasattr(state.call_stack, "__dict__")
+    assert not hasattr(state.call_stack.current_thread, "__dict__")
+    assert not hasattr(state.call_stack.current_element, "__dict__")
+
+
+def clean_output_whitespace(text):
+    output = ""
+
+    current_whitespace_start = -1
+    start_of_line = 0
+
+    for i, c in enumerate(text):
+        is_inline_whitespace = c in (" ", "\t")
+
+        if is_inline_whitespace and current_whitespace_start == -1:
+            current_whitespace_start = i
+
+        if not is_inline_whitespace:
+            if (
+                c != "\n"
+                and current_whitespace_start > 0
+                and current_whitespace_start != start_of_line
+            ):
+                output += " "
+            current_whitespace_start = -1
+
+        if c == "\n":
+            start_of_line = i + 1
+
+        if not is_inline_whitespace:
+            output += c
+
+    return output
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "  ",
+        "a  b",
+        "  a\t\tb  ",
+        "a \n  b \n\n\t c",
+        " \t \n \t \n",
+        "a\t\n",
+        "\n  a  \n",
+        "a \r b",
+        "a\r\n  b",
+        "  a\t \n  b  ",
+        "\ta \t b\t\n\t\tc  d\t",
+        "a\n\n  \n b",
+    ],
+)
+def test_clean_output_whitespace(state, text):
+    assert state._clean_output_whitespace(text) == clean_output_whitespace(text)
+
+
+def test_current_text_across_lines(state):
+    parts = ["Hello  ", " world\n", "  second ", "\t line \n\n third", "  "]
+
+    for i, part in enumerate(parts, 1):
+        state.push_to_output_stream(StringValue(part))
+        assert state.current_text == clean_output_whitespace("".join(parts[:i]))
+
+    state.pop_from_output_stream()
+    state.pop_from_output_stream()
+    assert state.current_text == clean_output_whitespace("".join(parts[:3]))
@@ -0,0 +1,20 @@
+from enum import IntEnum
+
+from inkpy.runtime.value import BoolValue, FloatValue, IntValue, StringValue, Value
+
+
+def test_create():
+    assert type(Value.create(True)) is BoolValue
+    assert type(Value.create(1.5)) is FloatValue
+    assert type(Value.create(1)) is IntValue
+    assert type(Value.create("foo")) is StringValue
+    assert Value.create({}) is None
+
+
+def test_create_subclass():
+    class Number(IntEnum):
+        ONE = 1
+
+    value = Value.create(Number.ONE)
+    assert type(value) is IntValue
+    assert value == 1
@@ -102,3 +102,31 @@ def test_variable_tunnel(compile_story):
     story = compile_story("variable_tunnel")
 
     assert "".join(story.continue_maximally()) == "STUFF\n"
+
+
+def test_observe_variable(compile_story):
+    story = compile_story("variable_get_set_api")
+    story.continue_maximally()
+
+    changes = []
+
+    @story.observe_variable("x")
+    def observer(name, value):
+        changes.append((name, value.value))
+
+    story.state.variables_state["x"] = 10
+    story.state.variables_state["x"] = 11
+    assert changes == [("x", 10), ("x", 11)]
+
+
+def test_observe_variable_undeclared(compile_story):
+    story = compile_story("variable_get_set_api")
+    story.continue_maximally()
+
+    changes = []
+
+    with pytest.raises(RuntimeError):
+        story.observe_variable("z", lambda name, value: changes.append(name))
+
+    story.state.variables_state["x"] = 10
+    assert changes == []